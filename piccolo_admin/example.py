@@ -108,8 +108,8 @@ except ImportError:
 
 
 MEDIA_ROOT = os.path.join(os.path.dirname(__file__), "example_media")
-if not USE_S3 and not os.path.exists(MEDIA_ROOT):
-    os.mkdir(MEDIA_ROOT)
+if not USE_S3:
+    os.makedirs(MEDIA_ROOT, exist_ok=True)
 
 
 class Sessions(SessionsBase):